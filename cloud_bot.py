@@ -16,6 +16,7 @@ import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 import pytz
+from report_summarizer import ReportSummarizer, LocalSummaryBackend, get_default_backend, escape_mrkdwn
 
 class CloudBotManager:
     def __init__(self):
@@ -26,6 +27,7 @@ class CloudBotManager:
         self.ist = pytz.timezone('Asia/Kolkata')
         self.slack_token = os.environ.get("SLACK_APP_TOKEN")
         self.slack_channel = os.environ.get("SLACK_CHANNEL_ID", "C09EBE0DEUX")
+        self.summarizer = None
         
     def log(self, message):
         """Log message with timestamp"""
@@ -153,6 +155,24 @@ class CloudBotManager:
             self.log(f"❌ Error sending Slack message: {e}")
             return False
     
+    def get_summarizer(self):
+        """Create the report summarizer on first use"""
+        if self.summarizer is None:
+            try:
+                backend = get_default_backend(log=self.log)
+            except Exception as e:
+                self.log(f"⚠️ AI summary backend unavailable, using local: {e}")
+                backend = LocalSummaryBackend()
+            
+            self.summarizer = ReportSummarizer(
+                backend=backend,
+                time_budget=float(os.environ.get("REPORT_SUMMARY_BUDGET", "20")),
+                max_workers=int(os.environ.get("REPORT_SUMMARY_WORKERS", "2")),
+                log=self.log
+            )
+            self.log(f"🧠 Report summarizer ready ({backend.name} backend)")
+        return self.summarizer
+    
     def post_daily_form(self):
         """Post daily form at 00:01 IST"""
         try:
@@ -251,9 +271,18 @@ class CloudBotManager:
             status_text += f"• *Completion Rate:* {(total_submitted/total_responsible*100):.1f}%" if total_responsible > 0 else "0%"
             
             if submissions:
+                try:
+                    digest = self.get_summarizer().summarize([sub[2] for sub in submissions])
+                except Exception as e:
+                    self.log(f"⚠️ Report summarization failed: {e}")
+                    digest = [None] * len(submissions)
+                
                 status_text += f"\n\n📝 *Today's Submissions:*\n"
-                for sub in submissions:
+                for sub, summary in zip(submissions, digest):
                     status_text += f"• <@{sub[0]}> - {sub[1]} ({sub[3][:16]})\n"
+                    summary = escape_mrkdwn(summary or "")
+                    if summary:
+                        status_text += f"    ↳ _{summary}_\n"
             
             if self.send_slack_message(status_text):
                 self.log("✅ [CLOUD SCHEDULER] Status report posted successfully")
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Report Summarizer
+Condenses the day's submissions.report_text into a short digest
+for the 08:30 status report, with batching, caching and a time budget
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+CACHE_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS report_summaries (
+        content_hash TEXT NOT NULL,
+        backend TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        created_ts DATETIME DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (content_hash, backend)
+    )
+'''
+
+BACKEND_CHOICES = ("auto", "gemini", "local")
+
+
+def escape_mrkdwn(text):
+    """Make user or model text safe to embed inside a Slack _italic_ span"""
+    text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    for char in "_*~`":
+        text = text.replace(char, " ")
+    return " ".join(text.split())
+
+
+class SummaryBackend:
+    """Base interface for summarization backends"""
+
+    name = "base"
+    cacheable = True
+
+    def summarize_batch(self, texts, timeout=None):
+        """Return one summary per input text, in the same order"""
+        raise NotImplementedError
+
+
+class LocalSummaryBackend(SummaryBackend):
+    """Deterministic offline stand-in: first sentence, trimmed to max_chars"""
+
+    name = "local"
+    cacheable = False
+
+    def __init__(self, max_chars=120):
+        self.max_chars = max_chars
+
+    def summarize_one(self, text):
+        """Summarize a single report without any model call"""
+        text = " ".join((text or "").split())
+        if not text:
+            return "No details provided."
+
+        for end in (". ", "! ", "? "):
+            if end in text:
+                text = text.split(end, 1)[0] + end.strip()
+                break
+
+        if len(text) > self.max_chars:
+            text = text[:self.max_chars - 1].rstrip() + "…"
+        return text
+
+    def summarize_batch(self, texts, timeout=None):
+        return [self.summarize_one(text) for text in texts]
+
+
+class GeminiSummaryBackend(SummaryBackend):
+    """Google Gemini backend - summarizes a whole batch in a single call"""
+
+    name = "gemini"
+
+    PROMPT = (
+        "You summarize daily kitchen inspection reports for a Slack digest.\n"
+        "For each numbered report below, write a single plain-text sentence "
+        "(max 25 words) covering issues, shortages or anything needing action.\n"
+        "Respond with a JSON array of strings only, one entry per report, "
+        "in the same order.\n\n"
+    )
+
+    def __init__(self, api_key, model_name="gemini-1.5-flash"):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+        self.name = f"gemini:{model_name}"
+
+    def summarize_batch(self, texts, timeout=None):
+        prompt = self.PROMPT + "\n\n".join(
+            f"Report {i}:\n{text}" for i, text in enumerate(texts, 1)
+        )
+
+        request_options = {"timeout": timeout} if timeout else None
+        response = self.model.generate_content(
+            prompt,
+            generation_config={"response_mime_type": "application/json"},
+            request_options=request_options,
+        )
+
+        summaries = json.loads(response.text)
+        if not isinstance(summaries, list) or len(summaries) != len(texts):
+            raise ValueError(f"Expected {len(texts)} summaries, got {response.text[:200]}")
+        return [" ".join(str(s).split()) for s in summaries]
+
+
+def get_default_backend(log=print):
+    """Pick Gemini when an API key is configured, otherwise the local stand-in"""
+    backend = os.environ.get("REPORT_SUMMARY_BACKEND", "auto").lower()
+    api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+
+    if backend not in BACKEND_CHOICES:
+        raise ValueError(
+            f"REPORT_SUMMARY_BACKEND must be one of {', '.join(BACKEND_CHOICES)}, got {backend!r}"
+        )
+
+    if backend == "local":
+        return LocalSummaryBackend()
+
+    if not api_key:
+        if backend == "gemini":
+            log("⚠️ REPORT_SUMMARY_BACKEND=gemini but no GEMINI_API_KEY set, using local")
+        return LocalSummaryBackend()
+
+    return GeminiSummaryBackend(
+        api_key, os.environ.get("GEMINI_MODEL", "gemini-1.5-flash")
+    )
+
+
+class ReportSummarizer:
+    """Batches, caches and time-boxes report summarization"""
+
+    def __init__(self, backend=None, db_path="kitchen_reports.db",
+                 max_batch_chars=12000, max_workers=2, time_budget=20.0, log=print):
+        self.backend = backend or LocalSummaryBackend()
+        self.fallback = LocalSummaryBackend()
+        self.db_path = db_path
+        self.max_batch_chars = max_batch_chars
+        self.max_workers = max_workers
+        self.time_budget = time_budget
+        self.log = log
+        self.ensure_cache_table()
+
+    @staticmethod
+    def content_hash(text):
+        """Stable cache key for a report's text"""
+        return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+    def ensure_cache_table(self):
+        """Create the summary cache table if it does not exist yet"""
+        with sqlite3.connect(self.db_path) as con:
+            con.execute(CACHE_TABLE_SQL)
+
+    def load_cached(self, hashes):
+        """Fetch cached summaries for the given hashes"""
+        if not hashes or not self.backend.cacheable:
+            return {}
+        placeholders = ",".join("?" * len(hashes))
+        with sqlite3.connect(self.db_path) as con:
+            cur = con.execute(
+                f"SELECT content_hash, summary FROM report_summaries "
+                f"WHERE backend = ? AND content_hash IN ({placeholders})",
+                [self.backend.name, *hashes],
+            )
+            return dict(cur.fetchall())
+
+    def store_cached(self, summaries):
+        """Persist freshly generated summaries keyed by content hash"""
+        if not summaries or not self.backend.cacheable:
+            return
+        with sqlite3.connect(self.db_path) as con:
+            con.executemany(
+                "INSERT OR REPLACE INTO report_summaries (content_hash, backend, summary) "
+                "VALUES (?, ?, ?)",
+                [(h, self.backend.name, s) for h, s in summaries.items()],
+            )
+
+    def make_batches(self, pending):
+        """Group (hash, text) pairs into as few batches as max_batch_chars allows"""
+        batches, current, size = [], [], 0
+        for item in pending:
+            length = len(item[1])
+            if current and size + length > self.max_batch_chars:
+                batches.append(current)
+                current, size = [], 0
+            current.append(item)
+            size += length
+        if current:
+            batches.append(current)
+        return batches
+
+    def summarize(self, texts):
+        """Return a summary per text; never blocks longer than time_budget"""
+        hashes = [self.content_hash(text) for text in texts]
+        summaries = self.load_cached(list(set(hashes)))
+
+        pending = {}
+        for h, text in zip(hashes, texts):
+            if h not in summaries and (text or "").strip():
+                pending.setdefault(h, text)
+
+        if pending:
+            summaries.update(self.run_batches(list(pending.items())))
+
+        return [
+            summaries.get(h) or self.fallback.summarize_one(text)
+            for h, text in zip(hashes, texts)
+        ]
+
+    def call_backend(self, texts, deadline):
+        """Run one backend call with whatever is left of the time budget"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("summary time budget already spent")
+        return self.backend.summarize_batch(texts, remaining)
+
+    def store_late(self, future, batch):
+        """Cache a batch that finished after the deadline so it is not re-sent"""
+        if future.cancelled():
+            return
+        try:
+            batch_summaries = future.result()
+            self.store_cached(
+                {h: summary for (h, _), summary in zip(batch, batch_summaries)}
+            )
+        except Exception as e:
+            self.log(f"⚠️ Late summary batch failed ({self.backend.name}): {e}")
+
+    def run_batches(self, pending):
+        """Send batches to the backend concurrently within the time budget"""
+        batches = self.make_batches(pending)
+        deadline = time.monotonic() + self.time_budget
+        results = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {
+                executor.submit(
+                    self.call_backend, [text for _, text in batch], deadline
+                ): batch
+                for batch in batches
+            }
+            done, not_done = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+
+            for future in done:
+                batch = futures[future]
+                try:
+                    batch_summaries = future.result()
+                except Exception as e:
+                    self.log(f"⚠️ Summary batch failed ({self.backend.name}): {e}")
+                    continue
+                results.update(
+                    (h, summary) for (h, _), summary in zip(batch, batch_summaries)
+                )
+
+            if not_done:
+                self.log(f"⚠️ Summary time budget exceeded - {len(not_done)} batch(es) deferred")
+                # Calls already in flight keep running; cache their output when it lands
+                for future in not_done:
+                    future.add_done_callback(
+                        lambda f, batch=futures[future]: self.store_late(f, batch)
+                    )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.store_cached(results)
+        self.log(f"🧠 Summarized {len(results)}/{len(pending)} new report(s) "
+                 f"in {len(batches)} {self.backend.name} call(s)")
+        return results
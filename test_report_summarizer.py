@@ -0,0 +1,84 @@
+import time
+
+from report_summarizer import (
+    ReportSummarizer, SummaryBackend, LocalSummaryBackend, escape_mrkdwn
+)
+
+
+class StubBackend(SummaryBackend):
+    """Records every call and optionally sleeps to simulate a slow model"""
+
+    name = "stub"
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    def summarize_batch(self, texts, timeout=None):
+        self.calls.append(list(texts))
+        time.sleep(self.delay)
+        return [f"summary of {text}" for text in texts]
+
+
+def make_summarizer(tmp_path, backend, **kwargs):
+    return ReportSummarizer(
+        backend=backend, db_path=str(tmp_path / "test.db"), log=lambda msg: None, **kwargs
+    )
+
+
+def test_make_batches_packs_within_limit(tmp_path):
+    summarizer = make_summarizer(tmp_path, LocalSummaryBackend(), max_batch_chars=10)
+    pending = [("a", "xxxx"), ("b", "xxxx"), ("c", "xx"), ("d", "xxxxxxxx"), ("e", "x" * 15)]
+
+    batches = summarizer.make_batches(pending)
+
+    assert [[h for h, _ in batch] for batch in batches] == [["a", "b", "c"], ["d"], ["e"]]
+
+
+def test_second_summarize_uses_cache(tmp_path):
+    backend = StubBackend()
+    summarizer = make_summarizer(tmp_path, backend)
+
+    first = summarizer.summarize(["Fridge broken.", "All good."])
+    second = summarizer.summarize(["Fridge broken.", "All good."])
+
+    assert first == second == ["summary of Fridge broken.", "summary of All good."]
+    assert len(backend.calls) == 1
+
+
+def test_duplicate_texts_sent_once(tmp_path):
+    backend = StubBackend()
+    summarizer = make_summarizer(tmp_path, backend)
+
+    result = summarizer.summarize(["Out of rice.", "Out of rice.", "Clean."])
+
+    assert result == ["summary of Out of rice.", "summary of Out of rice.", "summary of Clean."]
+    assert backend.calls == [["Out of rice.", "Clean."]]
+
+
+def test_budget_exceeded_returns_local_fallback(tmp_path):
+    backend = StubBackend(delay=1.0)
+    summarizer = make_summarizer(tmp_path, backend, time_budget=0.2)
+
+    start = time.monotonic()
+    result = summarizer.summarize(["Gas leak fixed. Checked twice."])
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.2 + 0.15
+    assert result == ["Gas leak fixed."]
+
+
+def test_late_batch_is_cached(tmp_path):
+    backend = StubBackend(delay=0.3)
+    summarizer = make_summarizer(tmp_path, backend, time_budget=0.05)
+
+    summarizer.summarize(["Late report."])
+    time.sleep(0.5)
+
+    assert summarizer.summarize(["Late report."]) == ["summary of Late report."]
+    assert len(backend.calls) == 1
+
+
+def test_escape_mrkdwn_neutralises_mentions_and_formatting():
+    assert escape_mrkdwn("<!channel> fridge_door *broke* & ~leaks~") == \
+        "&lt;!channel&gt; fridge door broke &amp; leaks"